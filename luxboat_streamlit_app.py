@@ -11,11 +11,16 @@ To run this app:
 3. Run: streamlit run luxboat_app.py
 """
 
+import hashlib
+import io
+from statistics import NormalDist
+
 import streamlit as st
-import pandas as pd
 import numpy as np
-from scipy import stats
-import matplotlib.pyplot as plt
+
+# Standard normal curve on a fixed z grid (±4σ), rescaled per plot
+Z = np.linspace(-4, 4, 1000)
+PDF_STD = np.exp(-0.5*Z*Z) / np.sqrt(2*np.pi)
 
 # Set page configuration
 st.set_page_config(
@@ -34,33 +39,44 @@ historical throughput data and desired confidence levels.
 # Sidebar for inputs
 st.sidebar.header("Input Parameters")
 
-# Function to calculate due date
-def calculate_due_date(inter_throughput_times, boats_needed, confidence_level):
+# Function to compute the data-dependent sample statistics
+@st.cache_data(show_spinner=False)
+def _sample_stats(times_tuple: tuple) -> dict:
     """
-    Calculate due date with specified confidence level.
+    Sample statistics of the inter-throughput times.
     
-    Parameters:
-    -----------
-    inter_throughput_times : list
-        List of inter-throughput times in hours
-    boats_needed : int
-        Number of boats to produce
-    confidence_level : float
-        Confidence level (e.g., 0.90 for 90%)
-    
-    Returns:
-    --------
-    dict : Dictionary with all calculation results
+    These depend only on the data, so they are cached separately from the
+    boats/confidence parameters and survive changes to those widgets.
     """
-    # Basic statistics
-    X_bar = np.mean(inter_throughput_times)
-    S_squared = np.var(inter_throughput_times, ddof=1)
-    S = np.std(inter_throughput_times, ddof=1)
+    x = np.asarray(times_tuple, dtype=np.float64)
+    n = x.size
+    
+    # Basic statistics (one sum and one dot product instead of
+    # separate mean/var/std passes)
+    X_bar = x.sum() / n
+    d = x - X_bar
+    S_squared = (d @ d) / (n - 1)
+    S = np.sqrt(S_squared)
     
-    # Lag-1 autocorrelation
-    series_1 = inter_throughput_times[:-1]
-    series_2 = inter_throughput_times[1:]
-    rho_1 = np.corrcoef(series_1, series_2)[0, 1]
+    # Lag-1 autocorrelation (Pearson correlation of consecutive pairs,
+    # same value as np.corrcoef without building the 2xN stack)
+    d_1 = x[:-1] - x[:-1].mean()
+    d_2 = x[1:] - x[1:].mean()
+    rho_1 = (d_1 @ d_2) / np.sqrt((d_1 @ d_1) * (d_2 @ d_2))
+    
+    return {
+        'X_bar': X_bar,
+        'S': S,
+        'S_squared': S_squared,
+        'rho_1': rho_1
+    }
+
+# Function to scale the sample statistics to an order
+def _scale(sample_stats, boats_needed, confidence_level):
+    """Scale the sample statistics up to an order of boats_needed boats."""
+    X_bar = sample_stats['X_bar']
+    S_squared = sample_stats['S_squared']
+    rho_1 = sample_stats['rho_1']
     
     # Calculate parameters
     mu_b = boats_needed * X_bar
@@ -69,7 +85,7 @@ def calculate_due_date(inter_throughput_times, boats_needed, confidence_level):
     sigma_b = np.sqrt(sigma_squared_b)
     
     # Calculate due date
-    z_alpha = stats.norm.ppf(confidence_level)
+    z_alpha = NormalDist().inv_cdf(confidence_level)
     T_due_hours = mu_b + z_alpha * sigma_b
     T_due_days = T_due_hours / 24
     
@@ -79,7 +95,7 @@ def calculate_due_date(inter_throughput_times, boats_needed, confidence_level):
     
     return {
         'mean': X_bar,
-        'std': S,
+        'std': sample_stats['S'],
         'variance': S_squared,
         'autocorrelation': rho_1,
         'mu_b': mu_b,
@@ -91,6 +107,374 @@ def calculate_due_date(inter_throughput_times, boats_needed, confidence_level):
         'average_time_days': average_time_days
     }
 
+# Function to calculate due date
+def calculate_due_date(times_tuple: tuple, boats_needed: int, confidence_level: float):
+    """
+    Calculate due date with specified confidence level.
+    
+    The data-dependent statistics are cached on times_tuple; changing only
+    the boats or confidence level reruns just the scalar scaling step.
+    
+    Parameters:
+    -----------
+    times_tuple : tuple
+        Inter-throughput times in hours
+    boats_needed : int
+        Number of boats to produce
+    confidence_level : float
+        Confidence level (e.g., 0.90 for 90%)
+    
+    Returns:
+    --------
+    dict : Dictionary with all calculation results
+    """
+    return _scale(_sample_stats(times_tuple), boats_needed, confidence_level)
+
+# Heavy libraries are imported on first use so the landing page loads fast
+def _pandas():
+    """Import pandas on first use (later calls hit the module cache)."""
+    import pandas as pd
+    return pd
+
+# Function to read an uploaded CSV file
+def read_uploaded_csv(file_bytes: bytes):
+    """
+    Parse the 'inter_throughput_time' column of uploaded CSV contents.
+    
+    Only that column is read, as float64, so pandas skips type inference
+    for everything else.
+    
+    Returns:
+    --------
+    numpy.ndarray or None : The parsed times, or None if the column is missing
+    """
+    pd = _pandas()
+    df = pd.read_csv(
+        io.BytesIO(file_bytes),
+        usecols=lambda col: col == 'inter_throughput_time',
+        dtype=np.float64
+    )
+    if 'inter_throughput_time' not in df.columns:
+        return None
+    return df['inter_throughput_time'].to_numpy()
+
+# Function to build the example CSV download
+@st.cache_data(show_spinner=False)
+def _example_csv(times_tuple):
+    """Encoded CSV bytes for the example download."""
+    pd = _pandas()
+    return pd.DataFrame({
+        'inter_throughput_time': list(times_tuple)
+    }).to_csv(index=False).encode()
+
+# Figures are kept in session state and only redrawn when their inputs change
+def _session_figure_png(key, figsize, args, draw):
+    """
+    Return PNG bytes of the session's figure stored under key.
+    
+    The Figure is created once per session (from matplotlib.figure, not
+    pyplot, so nothing is shared between sessions or threads).
+    draw(ax, *args) redraws it and the PNG is re-rendered only when args
+    differ from the previous call; otherwise the stored bytes are reused.
+    """
+    entry = st.session_state.get(key)
+    if entry is None:
+        from matplotlib.figure import Figure
+        fig = Figure(figsize=figsize)
+        entry = {'fig': fig, 'ax': fig.subplots(), 'args': None, 'png': None}
+        st.session_state[key] = entry
+    if entry['args'] != args:
+        entry['ax'].clear()
+        draw(entry['ax'], *args)
+        buf = io.BytesIO()
+        entry['fig'].savefig(buf, format='png', dpi=200, bbox_inches='tight')
+        entry['png'] = buf.getvalue()
+        entry['args'] = args
+    return entry['png']
+
+# Figure builders
+def _build_hist_chart(inter_throughput_times, mean):
+    """Histogram of inter-throughput times with the mean marked."""
+    import altair as alt
+    
+    # Bin on the server with NumPy; the browser only draws the bars
+    counts, edges = np.histogram(inter_throughput_times, bins=15)
+    bins = [
+        {'start': lo, 'end': hi, 'count': c}
+        for lo, hi, c in zip(edges[:-1].tolist(), edges[1:].tolist(), counts.tolist())
+    ]
+    
+    bars = alt.Chart(alt.Data(values=bins)).mark_bar(
+        color='steelblue', opacity=0.7, stroke='black'
+    ).encode(
+        x=alt.X('start:Q', title='Inter-Throughput Time (hours)'),
+        x2='end:Q',
+        y=alt.Y('count:Q', title='Frequency')
+    )
+    mean_data = alt.Data(values=[{'mean': float(mean), 'label': f"Mean: {mean:.1f} hrs"}])
+    mean_line = alt.Chart(mean_data).mark_rule(
+        color='red', strokeDash=[6, 4], strokeWidth=2
+    ).encode(
+        x='mean:Q',
+        tooltip=alt.Tooltip('mean:Q', title='Mean (hrs)', format='.1f')
+    )
+    mean_label = alt.Chart(mean_data).mark_text(
+        color='red', align='left', baseline='top', dx=5, y=5, fontWeight='bold'
+    ).encode(
+        x='mean:Q',
+        text='label:N'
+    )
+    return (bars + mean_line + mean_label).properties(
+        title='Distribution of Inter-Throughput Times'
+    )
+
+def _draw_pdf(ax, mu_b, sigma_b, due_hours, conf):
+    """Normal distribution of total time with the confidence area shaded."""
+    time_range = mu_b + sigma_b*Z
+    pdf = PDF_STD / sigma_b
+    
+    ax.plot(time_range, pdf, 'b-', linewidth=2, label='Distribution')
+    
+    # Shade confidence area
+    x_fill = time_range[time_range <= due_hours]
+    y_fill = pdf[time_range <= due_hours]
+    ax.fill_between(x_fill, y_fill, alpha=0.3, color='green', 
+                    label=f'{conf*100:.0f}% confidence')
+    
+    # Add lines
+    ax.axvline(mu_b, color='orange', linestyle='--', linewidth=2,
+               label=f"Average: {mu_b:.0f} hrs")
+    ax.axvline(due_hours, color='red', linestyle='--', linewidth=2,
+               label=f"Due date: {due_hours:.0f} hrs")
+    
+    ax.set_xlabel('Time (hours)')
+    ax.set_ylabel('Probability Density')
+    ax.set_title(f'Due Date with {conf*100:.0f}% Confidence')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+
+def _draw_series(ax, times_tuple, mean):
+    """Inter-throughput times plotted in production order."""
+    ax.plot(range(1, len(times_tuple)+1), times_tuple, 
+            marker='o', linestyle='-', color='steelblue')
+    ax.axhline(mean, color='red', linestyle='--', 
+               label=f"Mean: {mean:.1f} hrs")
+    ax.set_xlabel('Boat Number')
+    ax.set_ylabel('Inter-Throughput Time (hours)')
+    ax.set_title('Inter-Throughput Times Over Time')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+
+# Tab bodies (each runs as a fragment so its reruns stay scoped to the tab)
+@st.fragment
+def _tab1_body(results, boats_needed, confidence_level):
+    """Results tab: headline metrics and calculation breakdown."""
+    st.header("Due Date Calculation Results")
+    
+    # Main results in columns
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric(
+            label="Due Date",
+            value=f"{results['due_date_days']:.1f} days",
+            delta=f"{confidence_level*100:.0f}% confidence"
+        )
+    
+    with col2:
+        st.metric(
+            label="Average Time",
+            value=f"{results['average_time_days']:.1f} days",
+            delta="50% confidence"
+        )
+    
+    with col3:
+        st.metric(
+            label="Safety Time",
+            value=f"{results['safety_time_days']:.1f} days",
+            delta=f"+{(results['safety_time_days']/results['average_time_days']*100):.1f}%"
+        )
+    
+    st.markdown("---")
+    
+    # Detailed breakdown
+    st.subheader("Calculation Breakdown")
+    
+    breakdown = {
+        'Parameter': [
+            'Number of boats needed',
+            'Mean inter-throughput time',
+            'Standard deviation',
+            'Autocorrelation (ρ₁)',
+            'Expected time (μ_b)',
+            'Standard deviation (σ_b)',
+            'Z-score',
+            'Due date'
+        ],
+        'Value': [
+            f"{boats_needed}",
+            f"{results['mean']:.2f} hours",
+            f"{results['std']:.2f} hours",
+            f"{results['autocorrelation']:.3f}",
+            f"{results['mu_b']:.1f} hours ({results['average_time_days']:.1f} days)",
+            f"{results['sigma_b']:.2f} hours",
+            f"{results['z_score']:.2f}",
+            f"{results['due_date_hours']:.1f} hours ({results['due_date_days']:.1f} days)"
+        ]
+    }
+    
+    st.table(breakdown)
+    
+    # Interpretation
+    st.info(f"""
+    **Interpretation:** With {confidence_level*100:.0f}% confidence, the order of {boats_needed} boats 
+    will be completed within {results['due_date_days']:.1f} days. This includes 
+    {results['safety_time_days']:.1f} days of safety time to account for variability 
+    and autocorrelation in production times.
+    """)
+
+@st.fragment
+def _tab2_body(results, inter_throughput_times, times_tuple, confidence_level):
+    """Visualizations tab: histogram, confidence plot and time series."""
+    st.header("Data Visualizations")
+    
+    # Histogram
+    st.subheader("Distribution of Inter-Throughput Times")
+    st.altair_chart(_build_hist_chart(inter_throughput_times, results['mean']), use_container_width=True)
+    
+    # Normal distribution
+    st.subheader("Confidence Interval Visualization")
+    pdf_args = (results['mu_b'], results['sigma_b'],
+                results['due_date_hours'], confidence_level)
+    st.image(_session_figure_png('fig_pdf', (12, 6), pdf_args, _draw_pdf))
+    
+    # Time series plot
+    st.subheader("Time Series of Inter-Throughput Times")
+    series_args = (times_tuple, results['mean'])
+    st.image(_session_figure_png('fig_series', (12, 5), series_args, _draw_series))
+
+@st.fragment
+def _tab3_body(results, inter_throughput_times):
+    """Statistics tab: descriptive and advanced metrics plus raw data."""
+    st.header("Detailed Statistics")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("Descriptive Statistics")
+        desc_stats = {
+            'Statistic': ['Count', 'Mean', 'Std Dev', 'Min', 'Max', 'Range'],
+            'Value': [
+                inter_throughput_times.size,
+                f"{results['mean']:.2f} hrs",
+                f"{results['std']:.2f} hrs",
+                f"{inter_throughput_times.min():.2f} hrs",
+                f"{inter_throughput_times.max():.2f} hrs",
+                f"{np.ptp(inter_throughput_times):.2f} hrs"
+            ]
+        }
+        st.table(desc_stats)
+    
+    with col2:
+        st.subheader("Advanced Metrics")
+        adv_stats = {
+            'Metric': ['Variance', 'Autocorrelation', 'Coefficient of Variation'],
+            'Value': [
+                f"{results['variance']:.2f} hrs²",
+                f"{results['autocorrelation']:.3f}",
+                f"{(results['std']/results['mean']*100):.1f}%"
+            ]
+        }
+        st.table(adv_stats)
+    
+        # Interpretation of autocorrelation
+        if results['autocorrelation'] > 0.3:
+            st.warning("⚠️ **Moderate positive autocorrelation detected!** "
+                      "Consecutive throughput times are related.")
+        elif results['autocorrelation'] > 0.1:
+            st.info("ℹ️ Weak positive autocorrelation detected.")
+        else:
+            st.success("✓ Negligible autocorrelation.")
+    
+    # Show raw data
+    st.subheader("Raw Data")
+    raw_df = _pandas().DataFrame({
+        'Observation': np.arange(1, inter_throughput_times.size+1),
+        'Inter-Throughput Time (hours)': inter_throughput_times
+    })
+    st.dataframe(raw_df, use_container_width=True)
+
+@st.fragment
+def _tab4_body(times_tuple):
+    """Help tab: usage notes, formula and example CSV download."""
+    st.header("Help & Information")
+    
+    st.markdown("""
+    ### How to Use This Calculator
+    
+    1. **Input Data**: Choose one of three methods to input your data:
+       - Use the example data from the LuxBoat case
+       - Upload a CSV file with inter-throughput times
+       - Enter data manually
+    
+    2. **Set Parameters**: 
+       - Specify how many boats are needed
+       - Choose your desired confidence level (typically 80-95%)
+    
+    3. **Interpret Results**:
+       - The **due date** is when you can promise delivery
+       - The **safety time** is extra buffer to achieve your confidence level
+       - Higher confidence = longer due date = more safety time
+    
+    ### Key Concepts
+    
+    **Inter-Throughput Time**: The time between two consecutive completions
+    
+    **Autocorrelation**: Measures if consecutive times are related. Positive 
+    autocorrelation means if one boat takes longer, the next probably will too.
+    
+    **Confidence Level**: The probability that the actual completion time will 
+    be less than or equal to the quoted due date.
+    
+    **Safety Time**: Additional time added to the average to achieve the 
+    desired confidence level.
+    
+    ### Formula
+    
+    The due date is calculated using:
+    
+    ```
+    T_due = μ_b + z_α × σ_b
+    
+    where:
+    μ_b = b × X̄ (mean time for b boats)
+    σ_b² = [(1+ρ₁)/(1-ρ₁)] × b × S² (variance with autocorrelation)
+    z_α = z-score for desired confidence level
+    ```
+    
+    ### CSV Format
+    
+    Your CSV file should have a single column named `inter_throughput_time` 
+    with one time value per row (in hours):
+    
+    ```
+    inter_throughput_time
+    32.5
+    35.5
+    40.0
+    38.5
+    ```
+    """)
+    
+    # Download example CSV
+    csv = _example_csv(times_tuple[:10])
+    st.download_button(
+        label="📥 Download Example CSV",
+        data=csv,
+        file_name="example_inter_throughput_times.csv",
+        mime="text/csv"
+    )
+
 # Data input method selection
 data_input_method = st.sidebar.radio(
     "How would you like to input data?",
@@ -126,10 +510,17 @@ elif data_input_method == "Upload CSV File":
     
     if uploaded_file is not None:
         try:
-            df = pd.read_csv(uploaded_file)
-            if 'inter_throughput_time' in df.columns:
-                inter_throughput_times = df['inter_throughput_time'].tolist()
-                st.sidebar.success(f"✓ Loaded {len(inter_throughput_times)} data points")
+            # Parse each distinct upload once; reruns reuse the stored array
+            file_bytes = uploaded_file.getvalue()
+            csv_key = hashlib.md5(file_bytes).hexdigest()
+            if st.session_state.get('csv_key') != csv_key:
+                st.session_state['csv_arr'] = read_uploaded_csv(file_bytes)
+                st.session_state['csv_key'] = csv_key
+            
+            csv_arr = st.session_state['csv_arr']
+            if csv_arr is not None:
+                inter_throughput_times = csv_arr
+                st.sidebar.success(f"✓ Loaded {inter_throughput_times.size} data points")
             else:
                 st.sidebar.error("CSV must have a column named 'inter_throughput_time'")
         except Exception as e:
@@ -145,13 +536,19 @@ elif data_input_method == "Enter Manually":
     
     if manual_input:
         try:
-            inter_throughput_times = [float(x.strip()) for x in manual_input.split(',')]
-            st.sidebar.success(f"✓ Parsed {len(inter_throughput_times)} values")
+            # NumPy converts the fields in one call and raises ValueError
+            # on any field that isn't a single number
+            inter_throughput_times = np.array(manual_input.split(','), dtype=np.float64)
+            st.sidebar.success(f"✓ Parsed {inter_throughput_times.size} values")
         except ValueError:
             st.sidebar.error("Please enter valid numbers separated by commas")
 
+# Convert the data to a float64 array once; everything below reuses it
+if inter_throughput_times is not None:
+    inter_throughput_times = np.asarray(inter_throughput_times, dtype=np.float64)
+
 # Other inputs
-if inter_throughput_times:
+if inter_throughput_times is not None and inter_throughput_times.size > 0:
     boats_needed = st.sidebar.number_input(
         "Number of boats needed",
         min_value=1,
@@ -169,10 +566,13 @@ if inter_throughput_times:
     ) / 100
 
 # Main content
-if inter_throughput_times and len(inter_throughput_times) >= 2:
+if inter_throughput_times is not None and inter_throughput_times.size >= 2:
+    
+    # Hashable copy of the data for the cached helpers
+    times_tuple = tuple(inter_throughput_times.tolist())
     
     # Calculate results
-    results = calculate_due_date(inter_throughput_times, boats_needed, confidence_level)
+    results = calculate_due_date(times_tuple, boats_needed, confidence_level)
     
     # Create tabs
     tab1, tab2, tab3, tab4 = st.tabs([
@@ -183,251 +583,16 @@ if inter_throughput_times and len(inter_throughput_times) >= 2:
     ])
     
     with tab1:
-        st.header("Due Date Calculation Results")
-        
-        # Main results in columns
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.metric(
-                label="Due Date",
-                value=f"{results['due_date_days']:.1f} days",
-                delta=f"{confidence_level*100:.0f}% confidence"
-            )
-        
-        with col2:
-            st.metric(
-                label="Average Time",
-                value=f"{results['average_time_days']:.1f} days",
-                delta="50% confidence"
-            )
-        
-        with col3:
-            st.metric(
-                label="Safety Time",
-                value=f"{results['safety_time_days']:.1f} days",
-                delta=f"+{(results['safety_time_days']/results['average_time_days']*100):.1f}%"
-            )
-        
-        st.markdown("---")
-        
-        # Detailed breakdown
-        st.subheader("Calculation Breakdown")
-        
-        breakdown_df = pd.DataFrame({
-            'Parameter': [
-                'Number of boats needed',
-                'Mean inter-throughput time',
-                'Standard deviation',
-                'Autocorrelation (ρ₁)',
-                'Expected time (μ_b)',
-                'Standard deviation (σ_b)',
-                'Z-score',
-                'Due date'
-            ],
-            'Value': [
-                f"{boats_needed}",
-                f"{results['mean']:.2f} hours",
-                f"{results['std']:.2f} hours",
-                f"{results['autocorrelation']:.3f}",
-                f"{results['mu_b']:.1f} hours ({results['average_time_days']:.1f} days)",
-                f"{results['sigma_b']:.2f} hours",
-                f"{results['z_score']:.2f}",
-                f"{results['due_date_hours']:.1f} hours ({results['due_date_days']:.1f} days)"
-            ]
-        })
-        
-        st.table(breakdown_df)
-        
-        # Interpretation
-        st.info(f"""
-        **Interpretation:** With {confidence_level*100:.0f}% confidence, the order of {boats_needed} boats 
-        will be completed within {results['due_date_days']:.1f} days. This includes 
-        {results['safety_time_days']:.1f} days of safety time to account for variability 
-        and autocorrelation in production times.
-        """)
+        _tab1_body(results, boats_needed, confidence_level)
     
     with tab2:
-        st.header("Data Visualizations")
-        
-        # Histogram
-        st.subheader("Distribution of Inter-Throughput Times")
-        fig1, ax1 = plt.subplots(figsize=(10, 6))
-        ax1.hist(inter_throughput_times, bins=15, edgecolor='black', alpha=0.7, color='steelblue')
-        ax1.axvline(results['mean'], color='red', linestyle='--', linewidth=2, 
-                    label=f"Mean: {results['mean']:.1f} hrs")
-        ax1.set_xlabel('Inter-Throughput Time (hours)')
-        ax1.set_ylabel('Frequency')
-        ax1.set_title('Distribution of Inter-Throughput Times')
-        ax1.legend()
-        ax1.grid(True, alpha=0.3)
-        st.pyplot(fig1)
-        
-        # Normal distribution
-        st.subheader("Confidence Interval Visualization")
-        time_range = np.linspace(
-            results['mu_b'] - 4*results['sigma_b'], 
-            results['mu_b'] + 4*results['sigma_b'], 
-            1000
-        )
-        pdf = stats.norm.pdf(time_range, results['mu_b'], results['sigma_b'])
-        
-        fig2, ax2 = plt.subplots(figsize=(12, 6))
-        ax2.plot(time_range, pdf, 'b-', linewidth=2, label='Distribution')
-        
-        # Shade confidence area
-        x_fill = time_range[time_range <= results['due_date_hours']]
-        y_fill = stats.norm.pdf(x_fill, results['mu_b'], results['sigma_b'])
-        ax2.fill_between(x_fill, y_fill, alpha=0.3, color='green', 
-                         label=f'{confidence_level*100:.0f}% confidence')
-        
-        # Add lines
-        ax2.axvline(results['mu_b'], color='orange', linestyle='--', linewidth=2,
-                   label=f"Average: {results['mu_b']:.0f} hrs")
-        ax2.axvline(results['due_date_hours'], color='red', linestyle='--', linewidth=2,
-                   label=f"Due date: {results['due_date_hours']:.0f} hrs")
-        
-        ax2.set_xlabel('Time (hours)')
-        ax2.set_ylabel('Probability Density')
-        ax2.set_title(f'Due Date with {confidence_level*100:.0f}% Confidence')
-        ax2.legend()
-        ax2.grid(True, alpha=0.3)
-        st.pyplot(fig2)
-        
-        # Time series plot
-        st.subheader("Time Series of Inter-Throughput Times")
-        fig3, ax3 = plt.subplots(figsize=(12, 5))
-        ax3.plot(range(1, len(inter_throughput_times)+1), inter_throughput_times, 
-                marker='o', linestyle='-', color='steelblue')
-        ax3.axhline(results['mean'], color='red', linestyle='--', 
-                   label=f"Mean: {results['mean']:.1f} hrs")
-        ax3.set_xlabel('Boat Number')
-        ax3.set_ylabel('Inter-Throughput Time (hours)')
-        ax3.set_title('Inter-Throughput Times Over Time')
-        ax3.legend()
-        ax3.grid(True, alpha=0.3)
-        st.pyplot(fig3)
+        _tab2_body(results, inter_throughput_times, times_tuple, confidence_level)
     
     with tab3:
-        st.header("Detailed Statistics")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("Descriptive Statistics")
-            desc_stats = pd.DataFrame({
-                'Statistic': ['Count', 'Mean', 'Std Dev', 'Min', 'Max', 'Range'],
-                'Value': [
-                    len(inter_throughput_times),
-                    f"{results['mean']:.2f} hrs",
-                    f"{results['std']:.2f} hrs",
-                    f"{min(inter_throughput_times):.2f} hrs",
-                    f"{max(inter_throughput_times):.2f} hrs",
-                    f"{max(inter_throughput_times) - min(inter_throughput_times):.2f} hrs"
-                ]
-            })
-            st.table(desc_stats)
-        
-        with col2:
-            st.subheader("Advanced Metrics")
-            adv_stats = pd.DataFrame({
-                'Metric': ['Variance', 'Autocorrelation', 'Coefficient of Variation'],
-                'Value': [
-                    f"{results['variance']:.2f} hrs²",
-                    f"{results['autocorrelation']:.3f}",
-                    f"{(results['std']/results['mean']*100):.1f}%"
-                ]
-            })
-            st.table(adv_stats)
-            
-            # Interpretation of autocorrelation
-            if results['autocorrelation'] > 0.3:
-                st.warning("⚠️ **Moderate positive autocorrelation detected!** "
-                          "Consecutive throughput times are related.")
-            elif results['autocorrelation'] > 0.1:
-                st.info("ℹ️ Weak positive autocorrelation detected.")
-            else:
-                st.success("✓ Negligible autocorrelation.")
-        
-        # Show raw data
-        st.subheader("Raw Data")
-        raw_df = pd.DataFrame({
-            'Observation': range(1, len(inter_throughput_times)+1),
-            'Inter-Throughput Time (hours)': inter_throughput_times
-        })
-        st.dataframe(raw_df, use_container_width=True)
+        _tab3_body(results, inter_throughput_times)
     
     with tab4:
-        st.header("Help & Information")
-        
-        st.markdown("""
-        ### How to Use This Calculator
-        
-        1. **Input Data**: Choose one of three methods to input your data:
-           - Use the example data from the LuxBoat case
-           - Upload a CSV file with inter-throughput times
-           - Enter data manually
-        
-        2. **Set Parameters**: 
-           - Specify how many boats are needed
-           - Choose your desired confidence level (typically 80-95%)
-        
-        3. **Interpret Results**:
-           - The **due date** is when you can promise delivery
-           - The **safety time** is extra buffer to achieve your confidence level
-           - Higher confidence = longer due date = more safety time
-        
-        ### Key Concepts
-        
-        **Inter-Throughput Time**: The time between two consecutive completions
-        
-        **Autocorrelation**: Measures if consecutive times are related. Positive 
-        autocorrelation means if one boat takes longer, the next probably will too.
-        
-        **Confidence Level**: The probability that the actual completion time will 
-        be less than or equal to the quoted due date.
-        
-        **Safety Time**: Additional time added to the average to achieve the 
-        desired confidence level.
-        
-        ### Formula
-        
-        The due date is calculated using:
-        
-        ```
-        T_due = μ_b + z_α × σ_b
-        
-        where:
-        μ_b = b × X̄ (mean time for b boats)
-        σ_b² = [(1+ρ₁)/(1-ρ₁)] × b × S² (variance with autocorrelation)
-        z_α = z-score for desired confidence level
-        ```
-        
-        ### CSV Format
-        
-        Your CSV file should have a single column named `inter_throughput_time` 
-        with one time value per row (in hours):
-        
-        ```
-        inter_throughput_time
-        32.5
-        35.5
-        40.0
-        38.5
-        ```
-        """)
-        
-        # Download example CSV
-        example_data = pd.DataFrame({
-            'inter_throughput_time': inter_throughput_times[:10]
-        })
-        csv = example_data.to_csv(index=False)
-        st.download_button(
-            label="📥 Download Example CSV",
-            data=csv,
-            file_name="example_inter_throughput_times.csv",
-            mime="text/csv"
-        )
+        _tab4_body(times_tuple)
 
 else:
     st.warning("⚠️ Please input data using the sidebar options to begin calculations.")